@@ -1,4 +1,14 @@
-from . import agent
-from .agent import Agent
+import importlib
 
 __VERSION__ = "0.0.1"
+
+
+def __getattr__(name):
+    # agent imports the openshift and kubernetes clients, load it on first
+    # use so that the command line can parse its arguments without them
+    if name in ("agent", "Agent", "configure_logging"):
+        agent = importlib.import_module(".agent", __name__)
+
+        return agent if name == "agent" else getattr(agent, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,114 +1,88 @@
 import openshift as oc
 import multiprocessing as mp
+import concurrent.futures
+import contextlib
+import copy
 import os
+import re
+import atexit
+import threading
 import time
 import logging
 import datetime as dt
 import tempfile
+import urllib3
+from functools import cached_property
+from kubernetes import client, watch
+from kubernetes.client.rest import ApiException
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s %(levelname)-4s %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 
+def configure_logging(level=logging.INFO):
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s %(levelname)-4s %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
 
-def _parse_time(t, mask="%Y-%m-%dT%H:%M:%SZ"):
-    return dt.datetime.strptime(t, mask)
 
+# constant parts of oc command lines
+_PROCESS_ARGS = ("--local",)
+_DELETE_ARGS = ("--ignore-not-found=true",)
+
+_TIME_UNITS = {"s": 1, "m": 60, "h": 3600}
+_TIMEOUT_RE = re.compile(r"(\d+)([smh]?)")
+
+
+def _as_seconds(timeout):
+    # timeout can be given as seconds, timedelta or string with unit (60s, 15m, 2h)
+    if isinstance(timeout, dt.timedelta):
+        return int(timeout.total_seconds())
+    if isinstance(timeout, str):
+        m = _TIMEOUT_RE.fullmatch(timeout)
+        if m is None:
+            raise ValueError(
+                "Invalid timeout '{}', expected for example 60, 60s, 15m or 2h".format(
+                    timeout
+                )
+            )
+        return int(m.group(1)) * _TIME_UNITS.get(m.group(2), 1)
+    return int(timeout)
 
-def _check_pod_status(job):
-    unaccepted_reasons = (
-        "ErrImagePull",
-        "ImagePullBackOff",
-        "CrashLoopBackOff",
-    )
-    wait_reasons = ("waiting", "terminated", "running")
-    last_event = None
-    time_since_last_event = None
-
-    print_interval = 15
-    job_start_time = job.model.status.startTime
-
-    while True:
-        sel = oc.selector("pod", labels={"job-name": job.model.metadata.name})
-        pods = sel.objects()
-        pods = [x for x in pods if x.model.status.startTime >= job_start_time]
-
-        for pod in pods:
-            for status in pod.model.status.containerStatuses:
-                if status.phase == "Succeeded":
-                    continue
-
-                for w in wait_reasons:
-                    if status.state[w].reason != oc.Missing:
-                        wait_reason = status.state[w].reason
-
-                if last_event != wait_reason:
-                    last_event = wait_reason
-                    time_since_last_event = time.time()
-                    print_interval = 10
-
-                if wait_reason in unaccepted_reasons:
-                    logging.error(
-                        f"Pod {pod.model.metadata.name} is not ready, waiting for {status.state.waiting.reason}"
-                    )
-                    return False
-
-                diff = time.time() - time_since_last_event
-                if wait_reason not in ("Completed") and diff > print_interval + 5:
-                    print_interval += 10
-                    logging.warning(
-                        "pod {} has remained in state {} for {:.1f} seconds".format(
-                            pod.model.metadata.name,
-                            wait_reason,
-                            time.time() - time_since_last_event,
-                        )
-                    )
-        time.sleep(2)
-
-
-def _wait_for_status(obj, status, timeout):
-    r = oc.Result(f"wait-for-{status}")
-
-    r.add_action(
-        oc.oc_action(
-            oc.cur_context(),
-            "wait",
-            cmd_args=[
-                f"--timeout={timeout}",
-                "--for=condition=" + status,
-                obj.model.kind,
-                obj.model.metadata.name,
-            ],
-        )
-    )
 
-    r.fail_if(f"Unable to check for {status}")
+_CANONICAL_NAME_TABLE = str.maketrans({"_": "-", " ": "-", ".": "-", "/": "-"})
 
 
 def canonical_name(name, max_len=63):
-    name = (
-        name.lower()
-        .replace("_", "-")
-        .replace(" ", "-")
-        .replace(".", "-")
-        .strip()
-        .replace("/", "-")[0:max_len]
-    )
+    return name.lower().translate(_CANONICAL_NAME_TABLE).strip()[0:max_len]
 
-    return name
 
+_KUBECONFIG_DIR = "/tmp/oc-agent"
+_kubeconfig_lock = threading.Lock()
 
-def set_kubeconfig():
+
+def _remove_file(path):
     try:
-        os.mkdir("/tmp/oc-agent")
-    except:
+        os.unlink(path)
+    except FileNotFoundError:
         pass
 
-    tmpfile = tempfile.NamedTemporaryFile(dir="/tmp/oc-agent", mode='w+t', delete=False)
-    os.environ['KUBECONFIG'] = tmpfile.name
-    return tmpfile
+
+def set_kubeconfig():
+    # keep a kubeconfig given by the caller, otherwise create one temporary
+    # kubeconfig per process so that 'oc login' leaves ~/.kube/config alone
+    with _kubeconfig_lock:
+        path = os.environ.get("KUBECONFIG")
+        if path and os.access(path, os.W_OK):
+            return path
+
+        os.makedirs(_KUBECONFIG_DIR, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=_KUBECONFIG_DIR)
+        os.close(fd)
+
+        os.environ["KUBECONFIG"] = path
+        atexit.register(_remove_file, path)
+
+        return path
 
 class Agent:
     def __init__(
@@ -123,57 +97,111 @@ class Agent:
     ):
         self.project = project
         self.api_server_url = api_server_url
+        self._templates = {}
         self.kubeconfig = set_kubeconfig()
 
-        with oc.api_server(self.api_server_url), oc.project(self.project):
-            if username is not None and password is not None:
+        self.token = None
+        if username is not None and password is not None:
+            with oc.api_server(self.api_server_url), oc.project(self.project):
                 oc.login(username, password)
-            else:
-                self.token = None
-                if token is not None:
-                    self.token = token
-                elif token_from_env_key is not None:
-                    self.token = os.environ[token_from_env_key]
+                self.token = oc.get_auth_token()
+        elif token is not None:
+            self.token = token
+        elif token_from_env_key is not None:
+            self.token = os.environ[token_from_env_key]
 
-                assert (
-                    self.token is not None
-                ), "No login credentials given, either username/password or token is required"
+        assert (
+            self.token is not None
+        ), "No login credentials given, either username/password or token is required"
 
-                self.login_with_token(self.token)
+        self.login_with_token(self.token)
 
-            logging.info(f"Logged in as {oc.whoami()}")
+        with self._oc_context():
+            # whoami forks oc, skip it when the message would be dropped
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info("Logged in as %s", oc.whoami())
 
             logged_project = oc.get_project_name()
 
-            logging.info(f"Current project: {logged_project}")
+            logging.info("Current project: %s", logged_project)
 
             if logged_project == "default":
                 logging.warning(
                     "Logged in to project default, possible problem with privileges"
                 )
 
-    def __del__(self):
-        self.kubeconfig.close()
-        try:
-            os.unlink(self.kubeconfig.name)
-        except:
-            pass
-
     def login_with_token(self, token):
         assert token is not None, "No token given"
 
-        r = oc.Result("login_with_token")
+        self.token = token
 
-        r.add_action(
-            oc.oc_action(oc.cur_context(), "login", cmd_args=["--token", token])
-        )
-        r.fail_if("Error when trying to login with token")
+        # all kubernetes api calls share one authenticated connection pool
+        configuration = client.Configuration()
+        configuration.host = self.api_server_url
+        configuration.api_key = {"authorization": token}
+        configuration.api_key_prefix = {"authorization": "Bearer"}
+        # enough connections for the concurrent log fetches
+        configuration.connection_pool_maxsize = 16
+
+        self._api_client = client.ApiClient(configuration)
+
+        # api handles are created lazily on top of the new client
+        for api in ("batch", "core", "custom"):
+            self.__dict__.pop(api, None)
+
+        # the client does not talk to the server until the first request,
+        # make one cheap call so that a bad or expired token fails here
+        try:
+            self.core.list_namespaced_pod(self.project, limit=1)
+        except ApiException as e:
+            if e.status in (401, 403):
+                raise RuntimeError(
+                    "Login to server {} failed with token ***: {} {}".format(
+                        self.api_server_url, e.status, e.reason
+                    )
+                ) from None
+            raise
 
         logging.info(
-            "Login to server {} succeeded with token ***".format(self.api_server_url)
+            "Login to server %s succeeded with token ***", self.api_server_url
         )
         return True
 
+    @cached_property
+    def batch(self):
+        return client.BatchV1Api(self._api_client)
+
+    @cached_property
+    def core(self):
+        return client.CoreV1Api(self._api_client)
+
+    @cached_property
+    def custom(self):
+        return client.CustomObjectsApi(self._api_client)
+
+    @contextlib.contextmanager
+    def _oc_context(self):
+        # oc calls get server, token and namespace of this agent on the command
+        # line. openshift-client contexts are per thread, so enter this around
+        # each call instead of setting process or thread defaults.
+        with oc.api_server(self.api_server_url), oc.token(self.token), oc.project(
+            self.project
+        ):
+            yield oc.cur_context()
+
+    def _get_template(self, template_name):
+        if template_name not in self._templates:
+            try:
+                self._templates[template_name] = self.custom.get_namespaced_custom_object(
+                    "template.openshift.io", "v1", self.project, "templates", template_name
+                )
+            except ApiException:
+                logging.error("Unable to get template %s", template_name)
+                raise
+
+        # callers modify the template, hand out a copy
+        return copy.deepcopy(self._templates[template_name])
+
     def create_job_from_template(
         self,
         template_name,
@@ -189,41 +217,32 @@ class Agent:
             logging.warning("template_name should be lowercase")
             template_name = template_name.lower()
 
-        r = oc.Result("get-template")
-        r.add_action(
-            oc.oc_action(
-                oc.cur_context(),
-                "get",
-                cmd_args=["template", template_name, "-o", "json", None],
-            )
-        )
-        r.fail_if(f"Unable to get template {template_name}")
-
-        template = oc.APIObject(string_to_model=r.out().strip())
-        template.model.metadata.namespace = ""
+        with self._oc_context():
+            template = oc.APIObject(dict_to_model=self._get_template(template_name))
+            template.model.metadata.namespace = ""
 
-        # logging.debug(template.as_json())
-        num_objects = len(template.model.objects)
+            num_objects = len(template.model.objects)
 
-        logging.info(f"Found {template.kind()} '{template.name()}' from server")
+            logging.info("Found %s '%s' from server", template.kind(), template.name())
 
-        processed_template = template.process(parameters=parameters)
-        logging.info(f"Processed template with parameters: {parameters}")
+            processed_template = template.process(
+                parameters=parameters, cmd_args=_PROCESS_ARGS
+            )
+        logging.info("Processed template with parameters: %s", parameters)
 
         active_deadlines = [
             x.model.spec.template.spec.activeDeadlineSeconds for x in processed_template
         ]
 
-        timeout_s = timeout
-        if timeout_s[-1] == "s":
-            timeout_s = int(timeout[:-1])
+        timeout_s = _as_seconds(timeout)
 
         for i, dl in enumerate(active_deadlines):
             if dl != oc.Missing and dl != timeout_s:
                 logging.warning(
-                    "job/{}: wait-timeout {}s does not match template timeout {}s".format(
-                        processed_template[i].model.metadata.name, timeout_s, dl
-                    )
+                    "job/%s: wait-timeout %ss does not match template timeout %ss",
+                    processed_template[i].model.metadata.name,
+                    timeout_s,
+                    dl,
                 )
 
         job_name = [x.model.metadata.name for x in processed_template]
@@ -238,174 +257,284 @@ class Agent:
                 job_name[i] = canonical_name(job)
                 processed_template[i].model.metadata.name = job_name[i]
 
-        if delete_if_found is True:
-            for i, o in enumerate(processed_template):
+        # an empty template falls through to the assertion after create
+        if delete_if_found is True and len(processed_template) > 0:
+
+            def delete(o):
                 logging.info(
-                    f"Deleting existing {o.model.kind}/{o.model.metadata.name}"
+                    "Deleting existing %s/%s", o.model.kind, o.model.metadata.name
                 )
                 self.delete_object(o.model.kind, o.model.metadata.name)
 
-        obj_sel = oc.create(processed_template, cmd_args=None)
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(processed_template)
+            ) as executor:
+                list(executor.map(delete, processed_template))
 
-        assert len(obj_sel.objects()) > 0, "Failed to create any objects from template"
+        with self._oc_context():
+            obj_sel = oc.create(processed_template, cmd_args=None)
+            objects = obj_sel.objects()
 
-        for o in obj_sel.objects():
-            logging.info("Created {}/{}".format(o.model.kind, o.model.metadata.name))
+        assert len(objects) > 0, "Failed to create any objects from template"
+
+        for o in objects:
+            logging.info("Created %s/%s", o.model.kind, o.model.metadata.name)
 
         if run_async is True:
-            return
+            return True
 
-        ret = True
-        for o in obj_sel.objects():
-            ret = self.wait_until_finished(o, timeout)
-            if not ret:
-                ret = False
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(objects)) as executor:
+            results = list(
+                executor.map(lambda o: self.wait_until_finished(o, timeout_s), objects)
+            )
 
-        return ret
+        return all(results)
 
     def delete_object(self, kind, name, timeout="15s"):
-        r = oc.Result("delete-existing")
-        r.add_action(
-            oc.oc_action(
-                oc.cur_context(),
-                "delete",
-                cmd_args=[
-                    f"--timeout={timeout}",
-                    "--ignore-not-found=true",
-                    kind,
+        timeout_s = _as_seconds(timeout)
+
+        if kind == "Job":
+            try:
+                self.batch.delete_namespaced_job(
                     name,
-                ],
+                    self.project,
+                    propagation_policy="Background",
+                    _request_timeout=timeout_s,
+                )
+            except ApiException as e:
+                if e.status != 404:
+                    logging.error("Unable to delete %s %s", kind, name)
+                    raise
+            return
+
+        r = oc.Result("delete-existing")
+        # runs in the delete pool's worker threads, which have no context yet
+        with self._oc_context() as ctx:
+            r.add_action(
+                oc.oc_action(
+                    ctx,
+                    "delete",
+                    cmd_args=(f"--timeout={timeout_s}s",) + _DELETE_ARGS + (kind, name),
+                )
             )
-        )
         r.fail_if(f"Unable to delete {kind} {name}")
 
-    def wait_until_finished(self, obj, timeout):
-        def dump_failed_pod_information(pod):
-            logging.error("{}".format(pod.describe()))
+    def _list_unfinished_pods(self, obj):
+        # controller-uid is unique per job instance, so pods left behind by
+        # an earlier job with the same name are not returned
+        return self.core.list_namespaced_pod(
+            self.project,
+            label_selector=f"controller-uid={obj.model.metadata.uid}",
+            field_selector="status.phase!=Succeeded",
+        ).items
+
+    def get_logs_for_job(self, job):
+        pods = self.core.list_namespaced_pod(
+            self.project, label_selector=f"controller-uid={job.metadata.uid}"
+        ).items
+
+        def read_log(pod_and_container):
+            pod_name, container_name = pod_and_container
+            log = self._read_log(pod_name, container_name)
+            if not log.endswith("\n"):
+                log += "\n"
+            return "==> {}/{} <==\n{}".format(pod_name, container_name, log)
+
+        pairs = [(pod.metadata.name, c.name) for pod in pods for c in pod.spec.containers]
+
+        if len(pairs) == 0:
+            return ""
+
+        # log reads are network bound, fetch them all at once over the
+        # shared connection pool; map() keeps the pod/container order
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(pairs), 16)
+        ) as executor:
+            return "".join(executor.map(read_log, pairs))
+
+    def _read_log(self, pod_name, container_name):
+        # containers that never started have no logs, the api answers 400
+        try:
+            return self.core.read_namespaced_pod_log(
+                pod_name, self.project, container=container_name
+            )
+        except ApiException as e:
+            return "Unable to read logs of {}/{}: {} {}".format(
+                pod_name, container_name, e.status, e.reason
+            )
 
-            for k, v in pod.logs().items():
-                logging.error("{}".format(v.replace("\\n", "\n")))
+    def _describe_pod(self, pod):
+        lines = [
+            "Pod: {}".format(pod.metadata.name),
+            "Node: {}".format(pod.spec.node_name),
+            "Phase: {}".format(pod.status.phase),
+        ]
 
-        logging.info(
-            "Waiting for {}/{} to be ready, timeout={}".format(
-                obj.model.kind, obj.model.metadata.name, timeout
+        if pod.status.reason is not None:
+            lines.append(
+                "Reason: {} {}".format(pod.status.reason, pod.status.message or "")
             )
+
+        for cond in pod.status.conditions or []:
+            lines.append(
+                "Condition {}={} {} {}".format(
+                    cond.type, cond.status, cond.reason or "", cond.message or ""
+                ).rstrip()
+            )
+
+        statuses = (pod.status.init_container_statuses or []) + (
+            pod.status.container_statuses or []
         )
 
-        return_value = False
+        for status in statuses:
+            # state can be missing, and so can all of its fields
+            state = status.state
+            if state is not None and state.waiting is not None:
+                desc = "waiting, {}: {}".format(
+                    state.waiting.reason, state.waiting.message or ""
+                )
+            elif state is not None and state.terminated is not None:
+                desc = "terminated, {} exit code {}: {}".format(
+                    state.terminated.reason,
+                    state.terminated.exit_code,
+                    state.terminated.message or "",
+                )
+            elif state is not None and state.running is not None:
+                desc = "running since {}".format(state.running.started_at)
+            else:
+                desc = "unknown"
+
+            lines.append(
+                "Container {}: {}, restarts {}".format(
+                    status.name, desc.rstrip(": "), status.restart_count
+                )
+            )
+
+        try:
+            events = self.core.list_namespaced_event(
+                self.project,
+                field_selector=f"involvedObject.name={pod.metadata.name}",
+            ).items
+        except ApiException as e:
+            lines.append("Unable to list events: {} {}".format(e.status, e.reason))
+            events = []
+
+        for event in events:
+            lines.append(
+                "Event {} {}: {}".format(event.type, event.reason, event.message)
+            )
 
-        # timeout needs to be int from this point on
-        timeout_s = timeout
-        if timeout_s[-1] == "s":
-            timeout_s = int(timeout[:-1])
+        return "\n".join(lines)
 
-        start = dt.datetime.now()
-        last = dt.datetime.now()
-        remaining_wait_time = dt.timedelta(seconds=timeout_s)
+    def wait_until_finished(self, obj, timeout):
+        def dump_failed_pod_information(pod):
+            logging.error("%s", self._describe_pod(pod))
 
-        job_found = False
+            for c in pod.spec.containers:
+                logging.error("%s", self._read_log(pod.metadata.name, c.name))
 
-        for i in range(5):
-            # wait max 5 seconds for job to be created to openshift server
-            o = oc.selector("{}/{}".format(obj.model.kind, obj.model.metadata.name))
-            if o.count_existing() > 0:
-                job_found = True
-                break
+        timeout_s = _as_seconds(timeout)
 
-            time.sleep(1)
+        logging.info(
+            "Waiting for %s/%s to be ready, timeout=%ss",
+            obj.model.kind,
+            obj.model.metadata.name,
+            timeout_s,
+        )
 
-        if job_found == False:
-            logging.error("{}/{} not created to server after 5 seconds".format(obj.model.kind, obj.model.metadata.name))
-            return False
+        return_value = False
+        finished = False
+        resource_version = None
+        deadline = time.monotonic() + timeout_s
 
-        while True:
-            time.sleep(1)
+        # the apiserver or a load balancer can close the watch early, so
+        # reconnect from the last seen resource version until the deadline.
+        # without a resource version the watch starts with the current state
+        # of the job, so there is no need to check that it exists first
+        while not finished:
+            remaining = int(deadline - time.monotonic())
 
-            if remaining_wait_time < dt.timedelta(seconds=0):
-                logging.error("Timeout value {} reached".format(timeout))
-                sel = oc.selector("pod", labels={"job-name": obj.model.metadata.name})
+            if remaining <= 0:
+                logging.error("Timeout value %ss reached", timeout_s)
 
-                for pod in sel.objects():
+                for pod in self._list_unfinished_pods(obj):
                     dump_failed_pod_information(pod)
 
                 return False
 
-            now = dt.datetime.now()
-            if now - last > dt.timedelta(seconds=20):
-                remaining_wait_time -= dt.timedelta(seconds=20)
-                logging.info("Still waiting, {} remaining".format(remaining_wait_time))
-                last = now
+            w = watch.Watch()
 
             try:
-                o = oc.selector("{}/{}".format(obj.model.kind, obj.model.metadata.name))
-                if o.count_existing() == 0:
-                    logging.error("Did not find object {}/{}".format(obj.model.kind, obj.model.metadata.name))
-                    return False
-                o = o.object()
-            except oc.OpenShiftPythonException as e:
-                if "result" in e.as_dict():
-                    result = e.as_dict()["result"].as_dict()
-                    if result["actions"][0]["timeout"]:
-                        logging.error("Timeout value {} reached".format(timeout))
-                        sel = oc.selector(
-                            "pod", labels={"job-name": obj.model.metadata.name}
+                for event in w.stream(
+                    self.batch.list_namespaced_job,
+                    self.project,
+                    field_selector=f"metadata.name={obj.model.metadata.name}",
+                    resource_version=resource_version,
+                    timeout_seconds=remaining,
+                    _request_timeout=remaining + 10,
+                ):
+                    if event["type"] == "DELETED":
+                        w.stop()
+                        logging.error(
+                            "Did not find object %s/%s",
+                            obj.model.kind,
+                            obj.model.metadata.name,
                         )
-
-                        for pod in sel.objects():
-                            dump_failed_pod_information(pod)
-
                         return False
-                raise e
-
-            if o.model.status.succeeded == 1:
-                return_value = True
-                break
-            if o.model.status.failed == 1:
-                conds = o.model.status.conditions[0]
-                logging.error(
-                    "Job failed: {}, reason: {}".format(conds.message, conds.reason)
+
+                    o = event["object"]
+                    resource_version = o.metadata.resource_version
+
+                    if o.status.succeeded == 1:
+                        return_value = True
+                        finished = True
+                        w.stop()
+                        break
+                    if o.status.failed == 1:
+                        conds = o.status.conditions[0] if o.status.conditions else None
+                        logging.error(
+                            "Job failed: %s, reason: %s",
+                            conds.message if conds else None,
+                            conds.reason if conds else None,
+                        )
+                        finished = True
+                        w.stop()
+                        break
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                # resource version expired, start over from the current state
+                resource_version = None
+            except urllib3.exceptions.HTTPError as e:
+                logging.warning(
+                    "Watch of %s/%s interrupted, reconnecting: %s",
+                    obj.model.kind,
+                    obj.model.metadata.name,
+                    e,
                 )
-                return_Value = False
-                break
+                time.sleep(1)
 
         if not return_value:
-            job_start_time = obj.model.status.startTime
-            sel = oc.selector("pod", labels={"job-name": obj.model.metadata.name})
-            pods = sel.objects()
-            pods = [x for x in pods if x.model.status.startTime >= job_start_time]
+            pods = self._list_unfinished_pods(obj)
 
-            logging.error(
-                "Pods that failed: {}".format([x.model.metadata.name for x in pods])
-            )
+            logging.error("Pods that failed: %s", [x.metadata.name for x in pods])
             for pod in pods:
                 dump_failed_pod_information(pod)
 
         else:
-            o = oc.selector(
-                "{}/{}".format(obj.model.kind, obj.model.metadata.name)
-            ).object()
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(self.get_logs_for_job(o))
 
-            sel = oc.selector("pod", labels={"job-name": obj.model.metadata.name})
-
-            for pod in sel.objects():
-                for k, v in pod.logs().items():
-                    logging.info(v.replace("\\n", "\n"))
-
-            compl = (
-                _parse_time(obj.model.status.completionTime)
-                if obj.model.status.completionTime != oc.Missing
-                else None
-            )
-            start = (
-                _parse_time(obj.model.status.startTime)
-                if obj.model.status.startTime != oc.Missing
-                else None
-            )
-            msg = f"{obj.model.kind} {obj.model.metadata.name} finished successfully"
-
-            if compl is not None and start is not None:
-                msg += " after {}".format(compl - start)
-
-            logging.info(msg)
+            if o.status.completion_time is not None and o.status.start_time is not None:
+                logging.info(
+                    "%s %s finished successfully after %s",
+                    obj.model.kind,
+                    obj.model.metadata.name,
+                    o.status.completion_time - o.status.start_time,
+                )
+            else:
+                logging.info(
+                    "%s %s finished successfully", obj.model.kind, obj.model.metadata.name
+                )
 
         return return_value
@@ -0,0 +1,139 @@
+import argparse
+import logging
+import re
+
+
+_LOG_LEVELS = {
+    "critical": logging.CRITICAL,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
+
+def string_to_log_level(log_level):
+    try:
+        return _LOG_LEVELS[log_level]
+    except KeyError:
+        raise ValueError("Invalid log level: {}".format(log_level)) from None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        default="info",
+        help="log level: critical, error, warning, info, debug",
+    )
+    parser.add_argument(
+        "--command",
+        type=str,
+        default="create-job-from-template",
+        help="command: create-job-from-template",
+    )
+    parser.add_argument(
+        "--token-from-env-key",
+        type=str,
+        required=True,
+        default="ECFLOW_OPENSHIFT_TOKEN",
+        help="token from env: ECFLOW_OPENSHIFT_TOKEN",
+    )
+    parser.add_argument(
+        "--api-server-url",
+        type=str,
+        required=True,
+        help="api server url: https://api.openshift.com",
+    )
+    parser.add_argument(
+        "--project",
+        type=str,
+        required=True,
+        help="openshift project (namespace)",
+    )
+    parser.add_argument(
+        "--template-name",
+        type=str,
+        help="template name, when creating job from template",
+    )
+    parser.add_argument(
+        "--override-job-name",
+        type=str,
+        default=None,
+        help="override job name, when creating job from template",
+    )
+    parser.add_argument(
+        "--job-param",
+        type=str,
+        action="append",
+        default=[],
+        help="job parameters, when creating job from template",
+    )
+    parser.add_argument(
+        "--job-timeout",
+        type=str,
+        default="60s",
+        help="job timeout, when creating job from template",
+    )
+    args = parser.parse_args(argv)
+
+    for kv in args.job_param:
+        if "=" not in kv:
+            parser.error("--job-param must be given as key=value, got '{}'".format(kv))
+
+    # same format as agent._as_seconds accepts, checked here so that a typo
+    # fails before the agent is imported and logged in
+    if re.fullmatch(r"\d+[smh]?", args.job_timeout) is None:
+        parser.error(
+            "--job-timeout must be seconds or use unit s, m or h, got '{}'".format(
+                args.job_timeout
+            )
+        )
+
+    args.log_level = string_to_log_level(args.log_level)
+
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == "create-job-from-template":
+        assert args.template_name is not None, "template_name is required"
+
+        # importing the agent pulls in the openshift and kubernetes clients,
+        # only pay for it once the arguments are known to be usable
+        from .agent import Agent, configure_logging
+
+        # the log format only uses time, level and message, so skip collecting
+        # caller, thread and process information for every record
+        logging._srcfile = None
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+        configure_logging(args.log_level)
+
+        logging.debug("Arguments: %s", vars(args))
+
+        agent = Agent(
+            api_server_url=args.api_server_url,
+            project=args.project,
+            token_from_env_key=args.token_from_env_key,
+            log_level=args.log_level,
+        )
+
+        params = {k: v for k, _, v in (kv.partition("=") for kv in args.job_param)}
+
+        ret = agent.create_job_from_template(
+            template_name=args.template_name,
+            override_job_name=args.override_job_name,
+            parameters=params,
+            timeout=args.job_timeout,
+        )
+
+        return 0 if ret else 1
+    else:
+        print("Invalid command: {}".format(args.command))
+        return 1
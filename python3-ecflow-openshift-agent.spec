@@ -20,6 +20,7 @@ BuildRoot:      %{_tmppath}/%{name}-%{version}-%{release}-root-%(%{__id_u} -n)
 BuildRequires:  python3-devel
 Requires:       python3-openshift-client
 Requires:	python3-pyyaml
+Requires:	python3-kubernetes
 Provides:	python3dist(ecflow-openshift-agent)
 
 AutoReqProv: no
@@ -51,6 +52,7 @@ rm -rf %{buildroot}
 %defattr(-,root,root,0755)
 %{python3_sitelib}/ecflow_openshift_agent*
 %{_bindir}/run-agent.py
+%{_bindir}/ecflow-openshift-agent
 
 %changelog
 * Tue May 31 2022 Mikko Partio <mikko.partio@fmi.fi> - 22.5.31-1.fmi